@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import queue
+import asyncio
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional, Sequence, Union
 
 import sounddevice as sd
 import soundfile as sf
@@ -20,16 +22,23 @@ class SystemAudioRecorder:
         device: Optional[str] = None,
         samplerate: int = 16000,
         channels: int = 1,
+        blocksize: int = 2048,
     ) -> None:
         self.output_path = Path(output_path)
         self.device = device
         self.samplerate = samplerate
         self.channels = channels
-        self._queue: "queue.Queue[bytes]" = queue.Queue()
-        self._stream: Optional[sd.InputStream] = None
+        self.blocksize = blocksize
+        self._stream: Optional[sd.RawInputStream] = None
         self._writer: Optional[sf.SoundFile] = None
         self._thread: Optional[threading.Thread] = None
         self._running = threading.Event()
+        self._listeners: List[Callable[[bytes], None]] = []
+
+    def add_listener(self, listener: Callable[[bytes], None]) -> None:
+        """Receive every captured int16 block; must be registered before ``start``."""
+
+        self._listeners.append(listener)
 
     def start(self) -> None:
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -40,64 +49,207 @@ class SystemAudioRecorder:
             channels=self.channels,
             subtype="PCM_16",
         )
-        self._running.set()
-        self._stream = sd.InputStream(
+        # A blocking stream keeps PortAudio buffering in C; the writer thread
+        # pulls raw int16 blocks instead of a Python callback running per block.
+        self._stream = sd.RawInputStream(
             samplerate=self.samplerate,
             channels=self.channels,
-            callback=self._callback,
+            dtype="int16",
+            blocksize=self.blocksize,
+            latency="high",
             device=self.device,
         )
         self._stream.start()
+        self._running.set()
         self._thread = threading.Thread(target=self._writer_loop, daemon=True)
         self._thread.start()
 
-    def _callback(self, indata, frames, time, status):  # pragma: no cover - realtime
-        if status:
-            print(f"Recorder status: {status}")
-        self._queue.put(indata.copy())
-
-    def _writer_loop(self) -> None:
-        assert self._writer is not None
-        while self._running.is_set():
-            try:
-                data = self._queue.get(timeout=0.25)
-            except queue.Empty:
-                continue
-            self._writer.write(data)
-        while not self._queue.empty():
-            data = self._queue.get()
-            self._writer.write(data)
-        self._writer.flush()
-        self._writer.close()
-        self._writer = None
+    def _writer_loop(self) -> None:  # pragma: no cover - realtime
+        assert self._stream is not None and self._writer is not None
+        stream = self._stream
+        writer = self._writer
+        try:
+            while self._running.is_set():
+                data, overflowed = stream.read(self.blocksize)
+                if overflowed:
+                    print("Recorder status: input overflow")
+                writer.buffer_write(data, dtype="int16")
+                for listener in self._listeners:
+                    listener(data)
+        finally:
+            stream.stop()
+            stream.close()
+            self._stream = None
+            writer.flush()
+            writer.close()
+            self._writer = None
 
     def stop(self) -> None:
         self._running.clear()
-        if self._stream:
-            self._stream.stop()
-            self._stream.close()
-            self._stream = None
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2)
 
 
+class VadSegmenter:
+    """Detect the end of a spoken answer from recorder audio using WebRTC VAD."""
+
+    def __init__(
+        self,
+        samplerate: int = 16000,
+        channels: int = 1,
+        aggressiveness: int = 2,
+        frame_ms: int = 30,
+    ) -> None:
+        import webrtcvad
+
+        if samplerate not in {8000, 16000, 32000, 48000}:
+            raise ValueError(f"WebRTC VAD does not support {samplerate} Hz audio")
+        self.samplerate = samplerate
+        self.channels = channels
+        self._vad = webrtcvad.Vad(aggressiveness)
+        self._frame_bytes = samplerate * frame_ms // 1000 * 2
+        self._pending = bytearray()
+        self._lock = threading.Lock()
+        self._heard_speech = False
+        self._last_speech = 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._heard_speech = False
+
+    def feed(self, data) -> None:  # pragma: no cover - realtime
+        """Classify captured audio in VAD-sized frames; called from the recorder thread."""
+
+        if self.channels > 1:
+            data = memoryview(data).cast("h")[:: self.channels].tobytes()
+        pending = self._pending
+        pending += data
+        size = self._frame_bytes
+        offset = 0
+        while len(pending) - offset >= size:
+            frame = bytes(pending[offset : offset + size])
+            offset += size
+            if self._vad.is_speech(frame, self.samplerate):
+                with self._lock:
+                    self._heard_speech = True
+                    self._last_speech = time.monotonic()
+        del pending[:offset]
+
+    async def wait_for_end_of_utterance(
+        self,
+        max_wait: float = 30.0,
+        min_silence: float = 1.5,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """Return once speech is followed by ``min_silence`` seconds of quiet."""
+
+        self.reset()
+        deadline = time.monotonic() + max_wait
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return
+            with self._lock:
+                finished = self._heard_speech and now - self._last_speech >= min_silence
+            if finished:
+                return
+            await asyncio.sleep(poll_interval)
+
+
 class TextToSpeechEngine:
     """Convert interview questions into audible speech."""
 
+    # pyttsx3 always speaks on the system default output and its engine is
+    # not thread-safe, so synthesis jobs must be serialised.
+    device: Optional[str] = None
+    concurrent_synthesis = False
+
     def __init__(self, voice: Optional[str] = None) -> None:
         import pyttsx3
 
-        self.engine = pyttsx3.init()
-        if voice:
-            for v in self.engine.getProperty("voices"):
-                if voice.lower() in v.id.lower():
-                    self.engine.setProperty("voice", v.id)
-                    break
+        self._pyttsx3 = pyttsx3
+        self.voice = voice
+        self._engine = None
+
+    @property
+    def engine(self):
+        # pyttsx3 drivers must be used from the thread that created them, so
+        # the engine is built lazily by whichever thread speaks first.
+        if self._engine is None:
+            self._engine = self._pyttsx3.init()
+            if self.voice:
+                for v in self._engine.getProperty("voices"):
+                    if self.voice.lower() in v.id.lower():
+                        self._engine.setProperty("voice", v.id)
+                        break
+        return self._engine
 
     def speak(self, text: str) -> None:
         self.engine.say(text)
         self.engine.runAndWait()
 
+    def synth_to_file(self, text: str, path: Path) -> Path:
+        self.engine.save_to_file(text, str(path))
+        self.engine.runAndWait()
+        return path
+
+
+class StreamingTTS:
+    """Stream OpenAI text-to-speech audio to an output device as it is synthesised."""
+
+    SAMPLERATE = 24000  # OpenAI "pcm" responses are 24 kHz mono int16
+    concurrent_synthesis = True
+
+    def __init__(
+        self,
+        api_key: str,
+        voice: str = "alloy",
+        model: str = "tts-1",
+        device: Optional[str] = None,
+        chunk_size: int = 4096,
+    ) -> None:
+        from openai import OpenAI
+
+        self.client = OpenAI(api_key=api_key)
+        self.voice = voice
+        self.model = model
+        self.device = device
+        self.chunk_size = chunk_size
+
+    def speak(self, text: str) -> None:
+        """Play ``text`` starting with the first synthesised chunk; returns when playback ends."""
+
+        with sd.RawOutputStream(
+            samplerate=self.SAMPLERATE,
+            channels=1,
+            dtype="int16",
+            device=self.device,
+        ) as output, self.client.audio.speech.with_streaming_response.create(
+            model=self.model,
+            voice=self.voice,
+            input=text,
+            response_format="pcm",
+        ) as response:
+            leftover = b""
+            for chunk in response.iter_bytes(self.chunk_size):
+                chunk = leftover + chunk
+                usable = len(chunk) - len(chunk) % 2  # whole int16 samples only
+                output.write(chunk[:usable])
+                leftover = chunk[usable:]
+
+    def synth_to_file(self, text: str, path: Path) -> Path:
+        with self.client.audio.speech.with_streaming_response.create(
+            model=self.model,
+            voice=self.voice,
+            input=text,
+            response_format="wav",
+        ) as response:
+            response.stream_to_file(path)
+        return path
+
+
+SpeechEngine = Union[TextToSpeechEngine, StreamingTTS]
+
 
 class AudioBridge:
     """Coordinates system audio capture and text-to-speech output."""
@@ -105,16 +257,48 @@ class AudioBridge:
     def __init__(
         self,
         recorder: SystemAudioRecorder,
-        tts: TextToSpeechEngine,
+        tts: SpeechEngine,
     ) -> None:
         self.recorder = recorder
         self.tts = tts
+        # Speech blocks until playback finishes; a single dedicated thread keeps
+        # it off the event loop and satisfies pyttsx3's thread affinity.
+        self._speaker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+        # Rendered files never touch the engine, so they play on their own
+        # thread instead of queueing behind synthesis of later questions.
+        self._player = ThreadPoolExecutor(max_workers=1, thread_name_prefix="player")
 
     def start(self) -> None:
         self.recorder.start()
 
     def stop(self) -> None:
         self.recorder.stop()
+        self._speaker.shutdown(wait=False)
+        self._player.shutdown(wait=False)
+
+    def prerender(self, texts: Sequence[str], cache_dir: Path) -> List["asyncio.Future[Path]"]:
+        """Queue synthesis of each text to ``cache_dir``; one future per text, in order.
+
+        Jobs are submitted in order, so with serialised engines the first
+        question is ready before later ones and can be played while they render.
+        """
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        loop = asyncio.get_running_loop()
+        executor = None if self.tts.concurrent_synthesis else self._speaker
+        return [
+            loop.run_in_executor(executor, self.tts.synth_to_file, text, cache_dir / f"{idx}.wav")
+            for idx, text in enumerate(texts)
+        ]
+
+    def _play_file(self, path: Path) -> None:
+        data, samplerate = sf.read(str(path), dtype="int16")
+        sd.play(data, samplerate, device=self.tts.device)
+        sd.wait()
 
-    def ask(self, text: str) -> None:
-        self.tts.speak(text)
+    async def ask(self, text: str, audio_file: Optional[Path] = None) -> None:
+        loop = asyncio.get_running_loop()
+        if audio_file is not None:
+            await loop.run_in_executor(self._player, self._play_file, audio_file)
+        else:
+            await loop.run_in_executor(self._speaker, self.tts.speak, text)
@@ -5,9 +5,16 @@ from __future__ import annotations
 import asyncio
 import threading
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
-from .audio import AudioBridge, SystemAudioRecorder, TextToSpeechEngine
+from .audio import (
+    AudioBridge,
+    SpeechEngine,
+    StreamingTTS,
+    SystemAudioRecorder,
+    TextToSpeechEngine,
+    VadSegmenter,
+)
 from .cv_parser import extract_text
 from .interview_flow import InterviewFlow
 from .llm import LLMClient
@@ -15,9 +22,16 @@ from .meet import MeetClient
 from .settings import InterviewSettings
 from .transcript import TranscriptManager
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
 StatusCallback = Callable[[str], None]
 TranscriptCallback = Callable[[str], None]
 SummaryCallback = Callable[[str], None]
+CvParsedCallback = Callable[[str], None]
+FinishedCallback = Callable[[], None]
 
 
 class InterviewController:
@@ -29,91 +43,274 @@ class InterviewController:
         on_status: Optional[StatusCallback] = None,
         on_transcript: Optional[TranscriptCallback] = None,
         on_summary: Optional[SummaryCallback] = None,
+        on_finished: Optional[FinishedCallback] = None,
+        on_cv_parsed: Optional[CvParsedCallback] = None,
     ) -> None:
         self.settings = settings
         self.on_status = on_status
         self.on_transcript = on_transcript
         self.on_summary = on_summary
-        self._thread: Optional[threading.Thread] = None
+        self.on_finished = on_finished
+        self.on_cv_parsed = on_cv_parsed
+        self._task: Optional[asyncio.Future] = None
+        self._caller_loop: Optional[asyncio.AbstractEventLoop] = None
         self._stop_event = threading.Event()
+        # Mirrors _stop_event inside the interview loop so waits end at once.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_stop: Optional[asyncio.Event] = None
+
+    async def start(self) -> None:
+        """Launch the interview in the background and return immediately.
 
-    def start(self) -> None:
-        if self._thread and self._thread.is_alive():
+        Playwright drives Chromium through asyncio subprocesses, which GUI event
+        loops such as QtAsyncio do not provide, so the session runs on its own
+        loop in a daemon thread. Callbacks are delivered back on the loop that
+        awaited ``start``.
+        """
+
+        if self._task and not self._task.done():
             raise RuntimeError("Interview already running")
         self.settings.ensure_paths()
         self._stop_event.clear()
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        loop = asyncio.get_running_loop()
+        self._caller_loop = loop
+        self._task = loop.create_future()
+        self._task.add_done_callback(self._on_finished)
+        threading.Thread(target=self._run_in_background, args=(self._task,), daemon=True).start()
+
+    async def stop(self) -> None:
+        self.request_stop()
+
+    def request_stop(self) -> None:
+        """Ask the running interview to wrap up; safe to call from any thread."""
 
-    def stop(self) -> None:
         self._stop_event.set()
+        loop, async_stop = self._loop, self._async_stop
+        if loop is not None and async_stop is not None:
+            try:
+                loop.call_soon_threadsafe(async_stop.set)
+            except RuntimeError:  # loop already closed
+                pass
+
+    def run(self) -> None:
+        """Run the whole interview on the calling thread.
+
+        Callers without an event loop can end it early by calling
+        :meth:`request_stop` from another thread.
+        """
+
+        try:
+            if uvloop is not None:
+                uvloop.run(self._async_run())
+            else:
+                asyncio.run(self._async_run())
+        finally:
+            self._loop = None
+            self._async_stop = None
+
+    def _run_in_background(self, done: asyncio.Future) -> None:
+        error: Optional[Exception] = None
+        try:
+            self.run()
+        except Exception as exc:  # surfaced through the future
+            error = exc
+        assert self._caller_loop is not None
+        try:
+            if error is None:
+                self._caller_loop.call_soon_threadsafe(done.set_result, None)
+            else:
+                self._caller_loop.call_soon_threadsafe(done.set_exception, error)
+        except RuntimeError:  # caller loop already closed
+            pass
+
+    def _on_finished(self, task: asyncio.Future) -> None:
+        # Runs on the caller loop once the background session has ended.
+        if not task.cancelled() and task.exception() is not None:
+            self._emit_status(f"Interview failed: {task.exception()}")
+        if self.on_finished:
+            self.on_finished()
+
+    def _dispatch(self, callback: Optional[Callable[[str], None]], content: str) -> None:
+        if not callback:
+            return
+        loop = self._caller_loop
+        if loop is None:
+            callback(content)
+            return
+        try:
+            loop.call_soon_threadsafe(callback, content)
+        except RuntimeError:  # caller loop already closed
+            pass
 
     def _emit_status(self, message: str) -> None:
-        if self.on_status:
-            self.on_status(message)
+        self._dispatch(self.on_status, message)
 
     def _emit_transcript(self, content: str) -> None:
-        if self.on_transcript:
-            self.on_transcript(content)
+        self._dispatch(self.on_transcript, content)
 
     def _emit_summary(self, content: str) -> None:
-        if self.on_summary:
-            self.on_summary(content)
+        self._dispatch(self.on_summary, content)
+
+    def _create_tts(self) -> SpeechEngine:
+        settings = self.settings
+        if settings.tts_provider.lower() != "openai":
+            return TextToSpeechEngine(settings.question_voice)
+        api_key = settings.tts_api_key
+        if not api_key and settings.llm.provider.lower() == "openai":
+            api_key = settings.llm.api_key
+        if not api_key:
+            raise RuntimeError("An OpenAI API key is required for streaming text-to-speech")
+        return StreamingTTS(api_key, device=settings.virtual_microphone_device)
 
-    def _run(self) -> None:
-        asyncio.run(self._async_run())
+    async def _race_stop(self, future: asyncio.Future) -> bool:
+        """Wait for ``future`` unless a stop arrives first; True if it finished."""
+
+        assert self._async_stop is not None
+        stop = asyncio.ensure_future(self._async_stop.wait())
+        try:
+            await asyncio.wait({future, stop}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop.cancel()
+        return future.done()
+
+    async def _wait_for_answer(self, segmenter: Optional[VadSegmenter]) -> None:
+        if segmenter:
+            answer = asyncio.ensure_future(
+                segmenter.wait_for_end_of_utterance(max_wait=30, min_silence=1.5)
+            )
+        else:
+            answer = asyncio.ensure_future(asyncio.sleep(20))  # allow candidate to answer
+        if not await self._race_stop(answer):
+            answer.cancel()
+
+    async def _load_cv_text(self) -> str:
+        if self.settings.cv_text is not None:
+            return self.settings.cv_text
+        cv_text = await asyncio.to_thread(extract_text, self.settings.cv_path)
+        # Let the caller cache the text so a rerun with the same CV skips parsing.
+        self._dispatch(self.on_cv_parsed, cv_text)
+        return cv_text
+
+    async def _prepare_questions(
+        self, flow: InterviewFlow, bridge: AudioBridge, cache_dir: Path
+    ) -> List["asyncio.Future[Path]"]:
+        await asyncio.to_thread(flow.build)
+        return bridge.prerender(flow.questions, cache_dir)
+
+    def _rendered_file(self, render: "asyncio.Future[Path]") -> Optional[Path]:
+        if render.cancelled():
+            return None
+        exc = render.exception()
+        if exc is not None:
+            self._emit_status(f"Could not pre-render question audio ({exc}); speaking live.")
+            return None
+        return render.result()
 
     async def _async_run(self) -> None:
         settings = self.settings
+        self._async_stop = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        if self._stop_event.is_set():
+            self._async_stop.set()
         self._emit_status("Parsing CV document…")
-        cv_text = extract_text(settings.cv_path)
-        llm = LLMClient(settings.llm)
-        self._emit_status("Generating interview flow with LLM…")
-        flow = InterviewFlow(
-            llm,
-            cv_text=cv_text,
-            outline=settings.interview_outline,
-            warmup_prompt=settings.warmup_prompt,
-        )
-        steps = flow.build()
-        transcript = TranscriptManager(settings.transcript_path)
-        recorder = SystemAudioRecorder(settings.audio_output_path, device=settings.capture_loopback_device)
-        tts = TextToSpeechEngine(settings.question_voice)
-        bridge = AudioBridge(recorder, tts)
-        bridge.start()
-        video_dir = Path(settings.video_output_path).parent
-        video_dir.mkdir(parents=True, exist_ok=True)
-        meet = MeetClient(
-            meeting_url=settings.meeting_url,
-            display_name=settings.interviewer_name,
-            headless=False,
-            record_video_dir=video_dir,
+        # CV parsing and transcript setup (which kicks off the Whisper load) are
+        # independent, so they run side by side in worker threads.
+        cv_text, transcript = await asyncio.gather(
+            self._load_cv_text(),
+            asyncio.to_thread(TranscriptManager, settings.transcript_path),
+            return_exceptions=True,
         )
+        if isinstance(transcript, BaseException):
+            raise transcript
+        if isinstance(cv_text, BaseException):
+            # The manager was built alongside the failed parse; release it first.
+            transcript.close()
+            raise cv_text
         try:
-            async with meet.session() as page:
-                self._emit_status("Connected to Google Meet. Beginning interview…")
-                for step in steps:
-                    if self._stop_event.is_set():
-                        break
-                    prompt = step.question
-                    transcript.append(settings.interviewer_name, prompt)
-                    self._emit_transcript("\n".join(transcript._entries))
-                    bridge.ask(prompt)
-                    for follow in step.followups:
-                        transcript.append(settings.interviewer_name, f"(Optional follow-up) {follow}")
-                    await page.wait_for_timeout(1000)
-                    self._emit_status("Waiting for candidate response…")
-                    await asyncio.sleep(20)  # allow candidate to answer
-                await meet.send_chat_message("Thank you for your time! We'll follow up shortly.")
-                await meet.leave()
+            if self._stop_event.is_set():
+                self._emit_status("Interview cancelled.")
+                return
+            llm = LLMClient(settings.llm)
+            flow = InterviewFlow(
+                llm,
+                cv_text=cv_text,
+                outline=settings.interview_outline,
+                warmup_prompt=settings.warmup_prompt,
+            )
+            recorder = SystemAudioRecorder(
+                settings.audio_output_path, device=settings.capture_loopback_device
+            )
+            try:
+                segmenter: Optional[VadSegmenter] = VadSegmenter(
+                    recorder.samplerate, recorder.channels
+                )
+            except ImportError:
+                segmenter = None
+            else:
+                recorder.add_listener(segmenter.feed)
+            tts = self._create_tts()
+            bridge = AudioBridge(recorder, tts)
+            self._emit_status("Generating interview flow with LLM…")
+            # The LLM request and question synthesis run in worker threads while
+            # Chromium launches and joins the Meet; the plan is awaited once it is
+            # up and each question's audio only right before it is asked.
+            audio_path = settings.audio_output_path
+            cache_dir = audio_path.with_name(f"{audio_path.stem}-questions")
+            flow_task = asyncio.ensure_future(self._prepare_questions(flow, bridge, cache_dir))
+            video_dir: Optional[Path] = None
+            if settings.record_video:
+                video_dir = Path(settings.video_output_path).parent
+                video_dir.mkdir(parents=True, exist_ok=True)
+            meet = MeetClient(
+                meeting_url=settings.meeting_url,
+                display_name=settings.interviewer_name,
+                headless=False,
+                record_video_dir=video_dir,
+            )
+            renders: List["asyncio.Future[Path]"] = []
+            try:
+                bridge.start()
+                async with meet.session() as page:
+                    if await self._race_stop(flow_task):
+                        renders = flow_task.result()
+                        self._emit_status("Connected to Google Meet. Beginning interview…")
+                    questions = zip(flow.questions, flow.followups, renders)
+                    for prompt, followups, render in questions:
+                        # Only the current question's audio is awaited, so playback
+                        # starts while later questions are still rendering.
+                        if self._stop_event.is_set() or not await self._race_stop(render):
+                            break
+                        audio_file = self._rendered_file(render)
+                        transcript.append(settings.interviewer_name, prompt)
+                        self._emit_transcript(transcript.text)
+                        await bridge.ask(prompt, audio_file)
+                        for follow in followups:
+                            transcript.append(
+                                settings.interviewer_name, f"(Optional follow-up) {follow}"
+                            )
+                        await page.wait_for_timeout(1000)
+                        self._emit_status("Waiting for candidate response…")
+                        await self._wait_for_answer(segmenter)
+                    await meet.send_chat_message("Thank you for your time! We'll follow up shortly.")
+                    await meet.leave()
+            finally:
+                flow_task.cancel()
+                for render in renders:
+                    render.cancel()
+                bridge.stop()
+            try:
+                candidate_text = await asyncio.to_thread(
+                    transcript.transcribe_audio, settings.audio_output_path
+                )
+            except Exception as exc:
+                candidate_text = f"[Transcription unavailable: {exc}]"
+            transcript.append(settings.candidate_name, candidate_text)
+            self._emit_transcript(transcript.text)
+            # Partial summaries stream to the caller as the final request runs.
+            summary = await asyncio.to_thread(
+                transcript.summary, llm, on_partial=self._emit_summary
+            )
+            self._emit_summary(summary)
+            self._emit_status("Interview complete.")
         finally:
-            bridge.stop()
-        try:
-            candidate_text = transcript.transcribe_audio(settings.audio_output_path)
-        except Exception as exc:
-            candidate_text = f"[Transcription unavailable: {exc}]"
-        transcript.append(settings.candidate_name, candidate_text)
-        self._emit_transcript("\n".join(transcript._entries))
-        summary = transcript.summary(llm)
-        self._emit_summary(summary)
-        self._emit_status("Interview complete.")
+            transcript.close()
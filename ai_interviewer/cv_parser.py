@@ -2,25 +2,33 @@
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from typing import Iterable
 
 import docx
-from PyPDF2 import PdfReader
+import pypdfium2 as pdfium
 
 
 def _read_pdf(path: Path) -> Iterable[str]:
-    reader = PdfReader(str(path))
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        yield text.strip()
+    pdf = pdfium.PdfDocument(str(path))
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                # pdfium separates lines with \r\n; split so they match DOCX output.
+                yield from textpage.get_text_range().splitlines()
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
 
 
 def _read_docx(path: Path) -> Iterable[str]:
     document = docx.Document(str(path))
     for para in document.paragraphs:
-        if para.text:
-            yield para.text.strip()
+        yield para.text
 
 
 def _read_text(path: Path) -> Iterable[str]:
@@ -37,5 +45,6 @@ def extract_text(path: Path) -> str:
         lines = _read_docx(path)
     else:
         lines = _read_text(path)
-    content = "\n".join(line for line in lines if line)
-    return content.strip()
+    buffer = io.StringIO()
+    buffer.writelines(line + "\n" for line in lines if line.strip())
+    return buffer.getvalue().strip()
@@ -6,6 +6,8 @@ import json
 from dataclasses import dataclass, field
 from typing import Iterable, List, Optional
 
+import json_repair
+
 from .llm import LLMClient, LLMClientError
 from .settings import DEFAULT_OUTLINE
 
@@ -34,12 +36,29 @@ class InterviewFlow:
         self.outline = outline or DEFAULT_OUTLINE
         self.warmup_prompt = warmup_prompt or "Warmly welcome the candidate."
         self._steps: List[InterviewStep] = []
+        # Parallel per-field lists so the question loop indexes flat lists
+        # instead of dereferencing a dataclass per attribute.
+        self._titles: List[str] = []
+        self._questions: List[str] = []
+        self._followups: List[List[str]] = []
         self._current_index = 0
 
     @property
     def steps(self) -> Iterable[InterviewStep]:
         return list(self._steps)
 
+    @property
+    def titles(self) -> List[str]:
+        return self._titles
+
+    @property
+    def questions(self) -> List[str]:
+        return self._questions
+
+    @property
+    def followups(self) -> List[List[str]]:
+        return self._followups
+
     def build(self) -> List[InterviewStep]:
         """Ask the LLM to propose a structured set of questions."""
 
@@ -63,37 +82,47 @@ Start with an item called "Welcome" that follows this warmup instruction: {self.
         try:
             data = json.loads(raw)
         except json.JSONDecodeError:
-            # Attempt to coerce into JSON by extracting fenced code block
-            cleaned = self._extract_json_block(raw)
-            if not cleaned:
-                raise LLMClientError(
-                    "Failed to parse interview plan from the language model response"
-                )
-            data = json.loads(cleaned)
-        self._steps = [
-            InterviewStep(
-                title=item.get("title", f"Step {idx + 1}"),
-                question=item.get("question", ""),
-                followups=item.get("followups", []) or [],
+            # Tolerate markdown fences, surrounding prose and truncated output
+            data = json_repair.loads(raw)
+        steps = self._parse_steps(data) if isinstance(data, list) else []
+        if not steps:
+            raise LLMClientError(
+                "Failed to parse interview plan from the language model response"
             )
-            for idx, item in enumerate(data)
-        ]
+        self._steps = steps
+        self._titles = [step.title for step in self._steps]
+        self._questions = [step.question for step in self._steps]
+        self._followups = [step.followups for step in self._steps]
         self._current_index = 0
         return self._steps
 
-    def _extract_json_block(self, text: str) -> Optional[str]:
-        fence = "```"
-        if fence not in text:
-            return None
-        parts = text.split(fence)
-        for part in parts:
-            candidate = part.strip()
-            if candidate.startswith("[") and candidate.endswith("]"):
-                return candidate
-        return None
+    @staticmethod
+    def _parse_steps(data: list) -> List[InterviewStep]:
+        # Repaired or sloppy output can contain bare strings, items without a
+        # question, or a single follow-up string instead of a list.
+        steps: List[InterviewStep] = []
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            question = item.get("question")
+            if not isinstance(question, str) or not question.strip():
+                continue
+            followups = item.get("followups") or []
+            if isinstance(followups, str):
+                followups = [followups]
+            elif not isinstance(followups, list):
+                followups = []
+            steps.append(
+                InterviewStep(
+                    title=item.get("title") or f"Step {len(steps) + 1}",
+                    question=question.strip(),
+                    followups=[f for f in followups if isinstance(f, str) and f.strip()],
+                )
+            )
+        return steps
 
     def next_step(self) -> Optional[InterviewStep]:
-        if self._current_index >= len(self._steps):
+        if self._current_index >= len(self._questions):
             return None
         step = self._steps[self._current_index]
         self._current_index += 1
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .settings import LLMProviderConfig
 
@@ -24,6 +24,10 @@ class LLMClient:
 
     def __init__(self, config: LLMProviderConfig) -> None:
         self.config = config
+        # Provider SDK clients own their HTTP connection pools; reuse them so
+        # every call does not pay for a new client and TLS handshake.
+        self._provider_client = None
+        self._google_models: Dict[Tuple[str, float, int], object] = {}
 
     def _require_api_key(self) -> str:
         if not self.config.api_key:
@@ -32,6 +36,14 @@ class LLMClient:
             )
         return self.config.api_key
 
+    def _provider(self) -> str:
+        provider = self.config.provider.lower()
+        if provider in {"openai", "anthropic"}:
+            return provider
+        if provider in {"google", "gemini", "google-genai"}:
+            return "google"
+        raise LLMClientError(f"Unsupported provider '{self.config.provider}'.")
+
     def generate(
         self,
         prompt: str,
@@ -39,7 +51,7 @@ class LLMClient:
         temperature: float = 0.2,
         max_output_tokens: int = 512,
     ) -> LLMResponse:
-        provider = self.config.provider.lower()
+        provider = self._provider()
         if provider == "openai":
             return self._generate_openai(
                 prompt, system_prompt, temperature, max_output_tokens
@@ -48,21 +60,35 @@ class LLMClient:
             return self._generate_anthropic(
                 prompt, system_prompt, temperature, max_output_tokens
             )
-        if provider in {"google", "gemini", "google-genai"}:
-            return self._generate_google(
+        return self._generate_google(
+            prompt, system_prompt, temperature, max_output_tokens
+        )
+
+    def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.2,
+        max_output_tokens: int = 512,
+    ) -> Iterator[str]:
+        """Yield the response text in chunks as the provider produces them."""
+
+        provider = self._provider()
+        if provider == "openai":
+            return self._stream_openai(
                 prompt, system_prompt, temperature, max_output_tokens
             )
-        raise LLMClientError(f"Unsupported provider '{self.config.provider}'.")
+        if provider == "anthropic":
+            return self._stream_anthropic(
+                prompt, system_prompt, temperature, max_output_tokens
+            )
+        return self._stream_google(
+            prompt, system_prompt, temperature, max_output_tokens
+        )
 
     # Provider specific implementations -------------------------------------------------
 
-    def _generate_openai(
-        self,
-        prompt: str,
-        system_prompt: Optional[str],
-        temperature: float,
-        max_output_tokens: int,
-    ) -> LLMResponse:
+    def _openai_client(self):
         api_key = self._require_api_key()
         try:
             from openai import OpenAI
@@ -71,27 +97,55 @@ class LLMClient:
                 "The 'openai' package is required for OpenAI provider."
             ) from exc
 
-        client = OpenAI(api_key=api_key)
+        if self._provider_client is None:
+            self._provider_client = OpenAI(api_key=api_key)
+        return self._provider_client
+
+    @staticmethod
+    def _openai_messages(prompt: str, system_prompt: Optional[str]) -> List[Dict[str, str]]:
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _generate_openai(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_output_tokens: int,
+    ) -> LLMResponse:
+        client = self._openai_client()
         response = client.chat.completions.create(
             model=self.config.model,
-            messages=messages,
+            messages=self._openai_messages(prompt, system_prompt),
             temperature=temperature,
             max_tokens=max_output_tokens,
         )
         content = response.choices[0].message.content.strip()
         return LLMResponse(content=content, raw=response)
 
-    def _generate_anthropic(
+    def _stream_openai(
         self,
         prompt: str,
         system_prompt: Optional[str],
         temperature: float,
         max_output_tokens: int,
-    ) -> LLMResponse:
+    ) -> Iterator[str]:
+        client = self._openai_client()
+        stream = client.chat.completions.create(
+            model=self.config.model,
+            messages=self._openai_messages(prompt, system_prompt),
+            temperature=temperature,
+            max_tokens=max_output_tokens,
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _anthropic_client(self):
         api_key = self._require_api_key()
         try:
             import anthropic
@@ -100,7 +154,18 @@ class LLMClient:
                 "The 'anthropic' package is required for the Anthropic provider."
             ) from exc
 
-        client = anthropic.Anthropic(api_key=api_key)
+        if self._provider_client is None:
+            self._provider_client = anthropic.Anthropic(api_key=api_key)
+        return self._provider_client
+
+    def _generate_anthropic(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_output_tokens: int,
+    ) -> LLMResponse:
+        client = self._anthropic_client()
         response = client.messages.create(
             model=self.config.model,
             max_tokens=max_output_tokens,
@@ -111,13 +176,24 @@ class LLMClient:
         content = "".join(block.text for block in response.content)
         return LLMResponse(content=content.strip(), raw=response)
 
-    def _generate_google(
+    def _stream_anthropic(
         self,
         prompt: str,
         system_prompt: Optional[str],
         temperature: float,
         max_output_tokens: int,
-    ) -> LLMResponse:
+    ) -> Iterator[str]:
+        client = self._anthropic_client()
+        with client.messages.stream(
+            model=self.config.model,
+            max_tokens=max_output_tokens,
+            temperature=temperature,
+            system=system_prompt or "You are a helpful interview copilot.",
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            yield from stream.text_stream
+
+    def _google_model(self, temperature: float, max_output_tokens: int):
         api_key = self._require_api_key()
         try:
             import google.generativeai as genai
@@ -126,17 +202,48 @@ class LLMClient:
                 "The 'google-generativeai' package is required for Google provider."
             ) from exc
 
-        genai.configure(api_key=api_key)
-        generation_config = {
-            "temperature": temperature,
-            "max_output_tokens": max_output_tokens,
-        }
+        if self._provider_client is None:
+            genai.configure(api_key=api_key)
+            self._provider_client = genai
+        key = (self.config.model, temperature, max_output_tokens)
+        model = self._google_models.get(key)
+        if model is None:
+            generation_config = {
+                "temperature": temperature,
+                "max_output_tokens": max_output_tokens,
+            }
+            model = genai.GenerativeModel(self.config.model, generation_config=generation_config)
+            self._google_models[key] = model
+        return model
+
+    def _generate_google(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_output_tokens: int,
+    ) -> LLMResponse:
+        model = self._google_model(temperature, max_output_tokens)
         if system_prompt:
             prompt = f"System: {system_prompt}\n\nUser: {prompt}"
-        model = genai.GenerativeModel(self.config.model, generation_config=generation_config)
         response = model.generate_content(prompt)
         if response.candidates:
             text = response.candidates[0].content.parts[0].text
         else:
             text = json.dumps(response.to_dict())
         return LLMResponse(content=text.strip(), raw=response)
+
+    def _stream_google(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_output_tokens: int,
+    ) -> Iterator[str]:
+        model = self._google_model(temperature, max_output_tokens)
+        if system_prompt:
+            prompt = f"System: {system_prompt}\n\nUser: {prompt}"
+        for chunk in model.generate_content(prompt, stream=True):
+            if chunk.candidates:
+                for part in chunk.candidates[0].content.parts:
+                    yield part.text
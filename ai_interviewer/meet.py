@@ -5,29 +5,41 @@ from __future__ import annotations
 import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Optional, Tuple
 
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import Locator, Page, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 
 class MeetClient:
     """Launches a Chromium instance and joins a Google Meet."""
 
+    # Once the pre-join screen is up, optional controls are either present or
+    # not; probe them briefly rather than paying a count() round-trip each.
+    PROBE_TIMEOUT_MS = 500
+
     def __init__(
         self,
         meeting_url: str,
         display_name: str,
         headless: bool = False,
         record_video_dir: Optional[Path] = None,
+        record_video_size: Tuple[int, int] = (1024, 576),
     ) -> None:
         self.meeting_url = meeting_url
         self.display_name = display_name
         self.headless = headless
         self.record_video_dir = record_video_dir
+        self.record_video_size = record_video_size
         self._playwright = None
         self._browser = None
         self._context = None
         self._page: Optional[Page] = None
+        self._name_loc: Optional[Locator] = None
+        self._mic_loc: Optional[Locator] = None
+        self._cam_loc: Optional[Locator] = None
+        self._join_loc: Optional[Locator] = None
+        self._chat_loc: Optional[Locator] = None
 
     @asynccontextmanager
     async def session(self) -> AsyncIterator[Page]:
@@ -38,13 +50,19 @@ class MeetClient:
                 args=[
                     "--use-fake-ui-for-media-stream",
                     "--use-fake-device-for-media-stream",
+                    "--disable-dev-shm-usage",
+                    "--disable-gpu-compositing",
+                    "--disable-features=Translate,BackForwardCache",
                 ],
             )
             context_kwargs = {}
             if self.record_video_dir:
+                width, height = self.record_video_size
                 context_kwargs["record_video_dir"] = str(self.record_video_dir)
+                context_kwargs["record_video_size"] = {"width": width, "height": height}
             self._context = await self._browser.new_context(**context_kwargs)
             self._page = await self._context.new_page()
+            self._bind_locators(self._page)
             await self._page.goto(self.meeting_url)
             await self._handle_prejoin()
             try:
@@ -53,32 +71,41 @@ class MeetClient:
                 await self._context.close()
                 await self._browser.close()
 
+    def _bind_locators(self, page: Page) -> None:
+        self._name_loc = page.locator('input[aria-label="Your name"]')
+        self._mic_loc = page.locator('[aria-label="Turn off microphone (ctrl + d)"]')
+        self._cam_loc = page.locator('[aria-label="Turn off camera (ctrl + e)"]')
+        self._join_loc = page.locator(
+            "button:has-text('Ask to join'), button:has-text('Join now')"
+        ).first
+        self._chat_loc = page.locator('[aria-label="Send a message to everyone"]')
+
     async def _handle_prejoin(self) -> None:
         assert self._page is not None
         page = self._page
-        await page.wait_for_timeout(2000)
-        name_input = page.locator('input[aria-label="Your name"]')
-        if await name_input.count() > 0:
-            await name_input.fill(self.display_name)
-        mic_button = page.locator('[aria-label="Turn off microphone (ctrl + d)"]')
-        if await mic_button.count() > 0:
-            await mic_button.click()
-        cam_button = page.locator('[aria-label="Turn off camera (ctrl + e)"]')
-        if await cam_button.count() > 0:
-            await cam_button.click()
-        join_button = page.locator("button:has-text('Ask to join'), button:has-text('Join now')")
-        await join_button.first.click()
+        # goto() has already waited for the load event, but Meet renders the
+        # pre-join screen from JS; the join button is the one required control,
+        # so its appearance marks the screen as ready for the short probes.
+        await self._join_loc.wait_for(state="visible")
+        try:
+            await self._name_loc.fill(self.display_name, timeout=self.PROBE_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass
+        for toggle in (self._mic_loc, self._cam_loc):
+            try:
+                await toggle.click(timeout=self.PROBE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                pass
+        await self._join_loc.click()
         await page.wait_for_timeout(3000)
 
     async def send_chat_message(self, text: str) -> None:
         if not self._page:
             raise RuntimeError("Meet session not started")
-        page = self._page
-        await page.keyboard.press("CTRL+ALT+c")
-        await page.wait_for_timeout(500)
-        textbox = page.locator('[aria-label="Send a message to everyone"]')
-        await textbox.fill(text)
-        await textbox.press("Enter")
+        await self._page.keyboard.press("CTRL+ALT+c")
+        # fill() waits for the chat box to become editable once the panel opens.
+        await self._chat_loc.fill(text)
+        await self._chat_loc.press("Enter")
 
     async def leave(self) -> None:
         if self._page:
@@ -37,15 +37,21 @@ class InterviewSettings:
     audio_output_path: Path
     video_output_path: Path
     question_voice: str = "en-US-Wavenet-D"
+    tts_provider: str = "pyttsx3"
+    tts_api_key: Optional[str] = None
     capture_loopback_device: Optional[str] = None
     virtual_microphone_device: Optional[str] = None
     interview_outline: Optional[str] = None
     warmup_prompt: Optional[str] = None
+    record_video: bool = False
+    cv_text: Optional[str] = None
+    cv_digest: Optional[str] = None
 
     def ensure_paths(self) -> None:
         self.transcript_path.parent.mkdir(parents=True, exist_ok=True)
         self.audio_output_path.parent.mkdir(parents=True, exist_ok=True)
-        self.video_output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.record_video:
+            self.video_output_path.parent.mkdir(parents=True, exist_ok=True)
 
 
 DEFAULT_OUTLINE = """\
@@ -2,8 +2,66 @@
 
 from __future__ import annotations
 
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
+
+SUMMARY_PROMPT = (
+    "Summarise the interview transcript focusing on strengths, risks, and recommendations."
+)
+NOTES_PROMPT = (
+    "Write brief notes on this part of an interview transcript: what was asked, "
+    "what the candidate said, and any strengths or concerns it reveals."
+)
+
+
+def _select_device() -> Tuple[str, str]:
+    """Return the device and quantised compute type CTranslate2 supports here."""
+
+    try:
+        import ctranslate2
+
+        if ctranslate2.get_cuda_device_count() > 0:
+            supported = ctranslate2.get_supported_compute_types("cuda")
+            for compute_type in ("int8_float16", "int8"):
+                if compute_type in supported:
+                    return "cuda", compute_type
+    except Exception:  # pragma: no cover - CPU-only installs
+        pass
+    return "cpu", "int8"
+
+
+def _chunk_lines(lines: List[str], limit: int) -> List[str]:
+    """Pack transcript lines into chunks of at most ``limit`` characters."""
+
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for line in lines:
+        for piece in textwrap.wrap(line, limit) if len(line) > limit else [line]:
+            if current and size + len(piece) + 1 > limit:
+                chunks.append("\n".join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += len(piece) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _stream_summary(
+    llm, prompt: str, on_partial: Optional[Callable[[str], None]]
+) -> str:
+    """Stream the final summary request, reporting the text received so far."""
+
+    parts: List[str] = []
+    for piece in llm.stream(prompt, max_output_tokens=400):
+        parts.append(piece)
+        if on_partial:
+            on_partial("".join(parts).strip())
+    return "".join(parts).strip()
 
 
 class TranscriptManager:
@@ -13,30 +71,96 @@ class TranscriptManager:
         self.transcript_path = Path(transcript_path)
         self.model_size = model_size
         self._entries: List[str] = []
+        self._joined = ""
+        self.transcript_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self.transcript_path.open("w", encoding="utf-8")
+        self._whisper = None
+        self._pipeline = None
+        # Loading the model takes seconds, so it overlaps with the Meet session
+        # and is only awaited once transcription is actually needed.
+        self._model_ready = threading.Event()
+        threading.Thread(target=self._load_model, daemon=True).start()
+
+    def _load_model(self) -> None:
         try:
-            from faster_whisper import WhisperModel
+            from faster_whisper import BatchedInferencePipeline, WhisperModel
 
-            self._whisper: Optional[WhisperModel] = WhisperModel(model_size)
+            device, compute_type = _select_device()
+            self._whisper = WhisperModel(
+                self.model_size, device=device, compute_type=compute_type
+            )
+            self._pipeline = BatchedInferencePipeline(model=self._whisper)
+            if self._fh.closed:  # the interview ended while the model loaded
+                self._whisper = None
+                self._pipeline = None
         except Exception:  # pragma: no cover - optional dependency
             self._whisper = None
+            self._pipeline = None
+        finally:
+            self._model_ready.set()
+
+    @property
+    def text(self) -> str:
+        """The full transcript so far, joined once per append."""
 
-    def append(self, speaker: str, text: str) -> None:
+        return self._joined
+
+    def append(self, speaker: str, text: str) -> str:
         line = f"{speaker}: {text.strip()}"
+        self._joined = f"{self._joined}\n{line}" if self._entries else line
         self._entries.append(line)
-        self.transcript_path.parent.mkdir(parents=True, exist_ok=True)
-        self.transcript_path.write_text("\n".join(self._entries), encoding="utf-8")
+        self._fh.write(line + "\n")
+        self._fh.flush()
+        return line
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self._fh.close()
 
     def transcribe_audio(self, audio_path: Path) -> str:
-        if not self._whisper:
+        self._model_ready.wait()
+        if not self._pipeline:
             raise RuntimeError(
                 "faster-whisper is not installed. Install it or provide an OpenAI key"
             )
-        segments, _ = self._whisper.transcribe(str(audio_path))
+        # VAD splits the recording into speech chunks that are decoded in batches.
+        segments, _ = self._pipeline.transcribe(
+            str(audio_path), batch_size=16, vad_filter=True, beam_size=1
+        )
         text = " ".join(segment.text.strip() for segment in segments)
         return text.strip()
 
-    def summary(self, llm) -> str:
-        prompt = """Summarise the interview transcript focusing on strengths, risks, and recommendations."""
-        content = "\n".join(self._entries)
-        response = llm.generate(f"Transcript:\n{content}\n\n{prompt}", max_output_tokens=400)
-        return response.content.strip()
+    def summary(
+        self,
+        llm,
+        max_chunk_chars: int = 12000,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Summarise the transcript, map-reducing over chunks when it is long.
+
+        Transcripts longer than ``max_chunk_chars`` (roughly 3k tokens) are
+        condensed chunk by chunk in parallel, and only those notes are sent to
+        the final summary prompt, keeping every request small. The final
+        request is streamed and ``on_partial`` receives the text so far.
+        """
+
+        if len(self._joined) <= max_chunk_chars:
+            return _stream_summary(
+                llm, f"Transcript:\n{self._joined}\n\n{SUMMARY_PROMPT}", on_partial
+            )
+        chunks = _chunk_lines(self._entries, max_chunk_chars)
+
+        def take_notes(chunk: str) -> str:
+            response = llm.generate(
+                f"Transcript part:\n{chunk}\n\n{NOTES_PROMPT}", max_output_tokens=160
+            )
+            return response.content.strip()
+
+        with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as pool:
+            notes = list(pool.map(take_notes, chunks))
+        combined = "\n\n".join(f"Part {idx + 1}:\n{note}" for idx, note in enumerate(notes))
+        return _stream_summary(
+            llm,
+            f"Notes on consecutive parts of the interview transcript:\n{combined}\n\n{SUMMARY_PROMPT}",
+            on_partial,
+        )
@@ -2,27 +2,40 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import sys
+from collections import OrderedDict
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-from PySide6.QtCore import Qt
+from PySide6 import QtAsyncio
+from PySide6.QtCore import QFile, QTimer
+from PySide6.QtGui import QTextCursor
+from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (
     QApplication,
+    QCheckBox,
+    QComboBox,
     QFileDialog,
-    QHBoxLayout,
-    QLabel,
     QLineEdit,
     QMainWindow,
     QMessageBox,
     QPushButton,
     QTextEdit,
-    QVBoxLayout,
-    QWidget,
-    QComboBox,
 )
 
-from ai_interviewer import InterviewController, InterviewSettings
-from ai_interviewer.settings import LLMProviderConfig
+if TYPE_CHECKING:
+    from ai_interviewer import InterviewSettings
+
+UI_PATH = Path(__file__).with_name("interview_window.ui")
+_ARTIFACTS_ROOT = Path.home() / "AI-Interviewer" / "artifacts"
+_TRANSCRIPTS = _ARTIFACTS_ROOT / "transcripts"
+_AUDIO = _ARTIFACTS_ROOT / "audio"
+_VIDEO = _ARTIFACTS_ROOT / "video"
+CV_CACHE_SIZE = 8
+LOG_MAX_BLOCKS = 2000
+LOG_FLUSH_MS = 50
 
 
 class InterviewWindow(QMainWindow):
@@ -31,87 +44,85 @@ class InterviewWindow(QMainWindow):
         self.setWindowTitle("AI Interviewer MVP")
         self.resize(900, 720)
         self.controller = None
+        self._cv_dialog = None
+        # Parsed CV text keyed by SHA-256 of the file bytes, least recent first.
+        self._cv_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._log_buffer: List[str] = []
+        self._log_timer_pending = False
+        # Latest streamed summary, shown on the next coalesced flush.
+        self._pending_summary: Optional[str] = None
         self._build_ui()
 
     def _build_ui(self) -> None:
-        container = QWidget()
-        layout = QVBoxLayout(container)
-
-        form_layout = QVBoxLayout()
-
-        self.meeting_url = QLineEdit()
-        self.meeting_url.setPlaceholderText("https://meet.google.com/...")
-        form_layout.addWidget(QLabel("Google Meet URL"))
-        form_layout.addWidget(self.meeting_url)
-
-        self.candidate_name = QLineEdit()
-        form_layout.addWidget(QLabel("Candidate name"))
-        form_layout.addWidget(self.candidate_name)
-
-        self.interviewer_name = QLineEdit()
-        self.interviewer_name.setText("AI Interviewer")
-        form_layout.addWidget(QLabel("Display name (in Google Meet)"))
-        form_layout.addWidget(self.interviewer_name)
-
-        cv_layout = QHBoxLayout()
-        self.cv_path = QLineEdit()
-        browse_button = QPushButton("Browse…")
-        browse_button.clicked.connect(self._choose_cv)
-        cv_layout.addWidget(self.cv_path)
-        cv_layout.addWidget(browse_button)
-        form_layout.addWidget(QLabel("Candidate CV (PDF/DOCX/TXT)"))
-        form_layout.addLayout(cv_layout)
-
-        provider_layout = QHBoxLayout()
-        self.provider_combo = QComboBox()
-        self.provider_combo.addItems(["openai", "anthropic", "google"])
-        self.model_name = QLineEdit()
-        self.model_name.setPlaceholderText("Model, e.g. gpt-4o-mini")
-        provider_layout.addWidget(self.provider_combo)
-        provider_layout.addWidget(self.model_name)
-        form_layout.addWidget(QLabel("LLM Provider & Model"))
-        form_layout.addLayout(provider_layout)
-
-        self.api_key = QLineEdit()
-        self.api_key.setEchoMode(QLineEdit.Password)
-        form_layout.addWidget(QLabel("API key"))
-        form_layout.addWidget(self.api_key)
-
-        self.outline = QTextEdit()
-        self.outline.setPlaceholderText("Optional custom interview outline…")
-        self.outline.setFixedHeight(120)
-        form_layout.addWidget(QLabel("Interview outline"))
-        form_layout.addWidget(self.outline)
-
-        self.status_log = QTextEdit()
-        self.status_log.setReadOnly(True)
-        form_layout.addWidget(QLabel("Status & Transcript"))
-        form_layout.addWidget(self.status_log)
-
-        button_layout = QHBoxLayout()
-        self.start_button = QPushButton("Start interview")
-        self.start_button.clicked.connect(self._start)
-        self.stop_button = QPushButton("Stop")
-        self.stop_button.clicked.connect(self._stop)
-        button_layout.addWidget(self.start_button)
-        button_layout.addWidget(self.stop_button)
-        form_layout.addLayout(button_layout)
-
-        layout.addLayout(form_layout)
-        self.setCentralWidget(container)
+        loader = QUiLoader()
+        ui_file = QFile(str(UI_PATH))
+        if not ui_file.open(QFile.ReadOnly):
+            raise RuntimeError(f"Cannot open {UI_PATH}: {ui_file.errorString()}")
+        try:
+            self._ui = loader.load(ui_file, self)
+        finally:
+            ui_file.close()
+
+        self.meeting_url = self._ui.findChild(QLineEdit, "meeting_url")
+        self.candidate_name = self._ui.findChild(QLineEdit, "candidate_name")
+        self.interviewer_name = self._ui.findChild(QLineEdit, "interviewer_name")
+        self.cv_path = self._ui.findChild(QLineEdit, "cv_path")
+        self.provider_combo = self._ui.findChild(QComboBox, "provider_combo")
+        self.model_name = self._ui.findChild(QLineEdit, "model_name")
+        self.api_key = self._ui.findChild(QLineEdit, "api_key")
+        self.outline = self._ui.findChild(QTextEdit, "outline")
+        self.record_video = self._ui.findChild(QCheckBox, "record_video")
+        self.status_log = self._ui.findChild(QTextEdit, "status_log")
+        self.summary_view = self._ui.findChild(QTextEdit, "summary_view")
+        self.start_button = self._ui.findChild(QPushButton, "start_button")
+        self.stop_button = self._ui.findChild(QPushButton, "stop_button")
+
+        self.status_log.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self._ui.findChild(QPushButton, "browse_button").clicked.connect(self._choose_cv)
+        self.start_button.clicked.connect(lambda: asyncio.ensure_future(self._start()))
+        self.stop_button.clicked.connect(lambda: asyncio.ensure_future(self._stop()))
+        self.setCentralWidget(self._ui)
 
     # UI actions ---------------------------------------------------------------------
 
     def _choose_cv(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, "Select CV", "", "Documents (*.pdf *.docx *.txt)")
-        if path:
-            self.cv_path.setText(path)
+        # open() instead of a native modal keeps the Qt/asyncio loop serving
+        # timers and controller callbacks while the dialog is up.
+        dialog = QFileDialog(self, "Select CV", "", "Documents (*.pdf *.docx *.txt)")
+        dialog.setFileMode(QFileDialog.ExistingFile)
+        dialog.setOption(QFileDialog.DontUseNativeDialog, True)
+        dialog.fileSelected.connect(self.cv_path.setText)
+        self._cv_dialog = dialog
+        dialog.open()
 
     def _append_log(self, message: str) -> None:
-        self.status_log.append(message)
-        self.status_log.verticalScrollBar().setValue(self.status_log.verticalScrollBar().maximum())
+        # Bursts of controller callbacks are batched into one document update.
+        self._log_buffer.append(message)
+        self._schedule_flush()
+
+    def _show_summary(self, summary: str) -> None:
+        # Each streamed update carries the whole summary so far.
+        self._pending_summary = summary
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if not self._log_timer_pending:
+            self._log_timer_pending = True
+            QTimer.singleShot(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        self._log_timer_pending = False
+        if self._pending_summary is not None:
+            self.summary_view.setPlainText(self._pending_summary)
+            self._pending_summary = None
+        if not self._log_buffer:
+            return
+        self.status_log.append("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+        self.status_log.moveCursor(QTextCursor.End)
+        self.status_log.ensureCursorVisible()
 
-    def _start(self) -> None:
+    async def _start(self) -> None:
         if self.controller:
             QMessageBox.warning(self, "Interview running", "An interview is already in progress.")
             return
@@ -120,22 +131,44 @@ class InterviewWindow(QMainWindow):
         except ValueError as exc:
             QMessageBox.critical(self, "Invalid input", str(exc))
             return
-        self.controller = InterviewController(
+        # Deferred so the window paints before the LLM, audio and browser
+        # stacks pulled in by the controller are imported.
+        from ai_interviewer import InterviewController
+
+        controller = InterviewController(
             settings,
             on_status=lambda msg: self._append_log(f"[status] {msg}"),
             on_transcript=lambda txt: self._append_log(f"[transcript]\n{txt}"),
-            on_summary=lambda summary: self._append_log(f"[summary]\n{summary}"),
+            on_summary=self._show_summary,
+            on_finished=lambda: self._on_interview_finished(controller),
+            on_cv_parsed=lambda text: self._remember_cv(settings.cv_digest, text),
         )
+        self.controller = controller
+        self.summary_view.clear()
         self._append_log("Launching interview workflow…")
-        self.controller.start()
+        await controller.start()
 
-    def _stop(self) -> None:
+    async def _stop(self) -> None:
         if self.controller:
-            self.controller.stop()
+            await self.controller.stop()
             self._append_log("Stop requested. The interview will end shortly.")
             self.controller = None
 
+    def _on_interview_finished(self, controller) -> None:
+        # A stopped session may finish after a new one was started.
+        if self.controller is controller:
+            self.controller = None
+
+    def _remember_cv(self, digest: str, text: str) -> None:
+        self._cv_cache[digest] = text
+        self._cv_cache.move_to_end(digest)
+        while len(self._cv_cache) > CV_CACHE_SIZE:
+            self._cv_cache.popitem(last=False)
+
     def _build_settings(self) -> InterviewSettings:
+        from ai_interviewer import InterviewSettings
+        from ai_interviewer.settings import LLMProviderConfig
+
         meeting = self.meeting_url.text().strip()
         if not meeting:
             raise ValueError("Provide a Google Meet URL")
@@ -145,32 +178,43 @@ class InterviewWindow(QMainWindow):
         cv_path = Path(cv_file)
         if not cv_path.exists():
             raise ValueError("CV path does not exist")
+        try:
+            cv_digest = hashlib.sha256(cv_path.read_bytes()).hexdigest()
+        except OSError as exc:
+            raise ValueError(f"Could not read the CV: {exc}") from exc
+        cv_text = self._cv_cache.get(cv_digest)
+        if cv_text is not None:
+            self._cv_cache.move_to_end(cv_digest)
         provider = self.provider_combo.currentText()
         model = self.model_name.text().strip() or "gpt-4o-mini"
         api_key = self.api_key.text().strip() or None
         llm = LLMProviderConfig(provider=provider, model=model, api_key=api_key)
-        artifacts_dir = Path.home() / "AI-Interviewer" / "artifacts"
-        transcript_path = artifacts_dir / "transcripts" / f"{cv_path.stem}.txt"
-        audio_path = artifacts_dir / "audio" / f"{cv_path.stem}.wav"
-        video_path = artifacts_dir / "video" / f"{cv_path.stem}.webm"
+        transcript_path = _TRANSCRIPTS / f"{cv_path.stem}.txt"
+        audio_path = _AUDIO / f"{cv_path.stem}.wav"
+        video_path = _VIDEO / f"{cv_path.stem}.webm"
         return InterviewSettings(
             meeting_url=meeting,
             candidate_name=self.candidate_name.text().strip() or cv_path.stem,
             interviewer_name=self.interviewer_name.text().strip() or "AI Interviewer",
             cv_path=cv_path,
+            cv_text=cv_text,
+            cv_digest=cv_digest,
             llm=llm,
             transcript_path=transcript_path,
             audio_output_path=audio_path,
             video_output_path=video_path,
             interview_outline=self.outline.toPlainText().strip() or None,
+            record_video=self.record_video.isChecked(),
         )
 
 
 def main() -> None:
+    for directory in (_TRANSCRIPTS, _AUDIO, _VIDEO):
+        directory.mkdir(parents=True, exist_ok=True)
     app = QApplication(sys.argv)
     window = InterviewWindow()
     window.show()
-    sys.exit(app.exec())
+    QtAsyncio.run(handle_sigint=True)
 
 
 if __name__ == "__main__":  # pragma: no cover - manual execution